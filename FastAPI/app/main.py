@@ -1,14 +1,30 @@
+import asyncio
 import os
-from fastapi import FastAPI
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 
 from .routes.ws import router as ws_router
 from .routes.interviews import router as interviews_router
+from .routes.admin import router as admin_router
+from .services.fallback import load_question_bank
+from .services.monitor import start_loop_watchdog, stop_loop_watchdog, record_route_timing
 
 load_dotenv()
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    start_loop_watchdog()
+    # Warm the fallback interviewer's question bank off the loop so replies stay in-memory
+    await asyncio.to_thread(load_question_bank)
+    yield
+    stop_loop_watchdog()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Allow local dev clients
 origins = [
@@ -25,3 +41,17 @@ app.add_middleware(
 
 app.include_router(ws_router)
 app.include_router(interviews_router)
+app.include_router(admin_router)
+
+
+@app.middleware("http")
+async def time_routes(request: Request, call_next):
+    start = time.perf_counter()
+    response = await call_next(request)
+    elapsed = time.perf_counter() - start
+    # Unmatched paths (404s, scanners) share one key so the timings table stays bounded
+    route = request.scope.get("route")
+    path = getattr(route, "path", None) or "<unmatched>"
+    record_route_timing(f"{request.method} {path}", elapsed)
+    response.headers["Server-Timing"] = f"total;dur={elapsed * 1000:.1f}"
+    return response
@@ -0,0 +1,45 @@
+import asyncio
+import hmac
+import os
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from ..services.monitor import sample_profile, route_timings
+
+router = APIRouter()
+
+MAX_PROFILE_SECONDS = 30.0
+
+# One profile at a time: each run holds a default-executor thread for its whole duration
+_profile_lock = asyncio.Lock()
+
+
+def _check_token(token: Optional[str]):
+    expected = os.getenv("ADMIN_TOKEN")
+    # Admin endpoints are disabled unless a token is configured
+    if not expected or not token or not hmac.compare_digest(token.encode("utf-8"), expected.encode("utf-8")):
+        raise HTTPException(status_code=403, detail="Forbidden")
+
+
+@router.get("/admin/profile", response_class=PlainTextResponse)
+async def profile(seconds: float = 5.0, interval: float = 0.005, x_admin_token: Optional[str] = Header(None)):
+    """
+    Run a time-boxed sampling profile of this worker and return collapsed stacks
+    (flamegraph.pl / speedscope compatible).
+    """
+    _check_token(x_admin_token)
+    seconds = min(max(seconds, 0.1), MAX_PROFILE_SECONDS)
+    interval = min(max(interval, 0.001), seconds)
+    if _profile_lock.locked():
+        raise HTTPException(status_code=409, detail="A profile is already running")
+    async with _profile_lock:
+        return await asyncio.to_thread(sample_profile, seconds, interval)
+
+
+@router.get("/admin/timings")
+async def timings(x_admin_token: Optional[str] = Header(None)):
+    """Aggregated per-route and per-stage timings for this worker."""
+    _check_token(x_admin_token)
+    return {"ok": True, "timings": route_timings()}
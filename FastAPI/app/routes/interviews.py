@@ -1,4 +1,5 @@
 from typing import Optional, List
+import asyncio
 import json
 import os
 from pydantic import BaseModel
@@ -6,6 +7,7 @@ from fastapi import APIRouter
 
 from ..services.groq_client import get_groq_client, GROQ_LLM_MODEL
 from ..services.evaluation import evaluate_interview
+from ..services.fallback import seed_questions
 
 router = APIRouter()
 
@@ -80,6 +82,12 @@ async def generate_interview(spec: InterviewSpec):
             else:
                 payload = {"raw": raw}
 
+        # Keep the questions around for the offline fallback interviewer; never fail the request over it
+        try:
+            await asyncio.to_thread(seed_questions, spec.role, spec.difficulty, payload)
+        except Exception as e:
+            print("[Fallback] seeding failed:", e)
+
         return {"ok": True, "generated": payload}
     except Exception as e:
         return {"ok": False, "error": str(e)}
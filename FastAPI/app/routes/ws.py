@@ -1,5 +1,6 @@
 import json
 import os
+import time
 from io import BytesIO
 from tempfile import NamedTemporaryFile
 from typing import List, Dict, Any
@@ -15,17 +16,29 @@ from ..services.groq_client import (
     DEFAULT_TTS_VOICE,
 )
 from ..services.stt import transcribe_webm_bytes
+from ..services.audio import preprocess_audio
 from ..services.llm import generate_reply
 from ..services.tts import synthesize_tts
 from ..services.scoring import evaluate_conversation
+from ..services.recorder import get_session_recorder
+from ..services.monitor import record_route_timing, merge_route_timings
+from ..services.protocol import negotiate
 
 router = APIRouter()
 
 
 @router.websocket("/ws/interview")
 async def interview_socket(websocket: WebSocket):
-    await websocket.accept()
-    print("✅ Client connected")
+    # Server->client framing is negotiated via the subprotocol header (see services/protocol.py)
+    subprotocol, proto = negotiate(websocket.scope.get("subprotocols"))
+    await websocket.accept(subprotocol=subprotocol)
+    print(f"✅ Client connected (protocol: {subprotocol or 'v1'})")
+    recorder = get_session_recorder()
+    recorder.event("session", {"subprotocol": subprotocol})
+    # Per-stage timings for this session (stt/llm/tts/evaluate/turn)
+    websocket.state.timings = recorder.timings
+    session_start = time.perf_counter()
+    websocket = recorder.wrap(websocket)
 
     audio_buffer = bytearray()
     history: List[Dict[str, Any]] = []  # [{role: user|assistant, content: str}]
@@ -71,133 +84,121 @@ async def interview_socket(websocket: WebSocket):
                     
                     history.append({"role": "assistant", "content": greeting})
                     
-                    await websocket.send_text(json.dumps({
+                    await proto.send(websocket, {
                         "type": "assistant_text",
                         "transcript": "",
                         "text": greeting,
-                    }))
+                    })
                     
                     # Generate TTS for greeting
                     try:
-                        audio_bytes, mime = await synthesize_tts(
+                        audio_bytes, mime = await recorder.stage("tts", synthesize_tts(
                             tts_client,
                             greeting,
                             model=tts_model,
                             voice=tts_voice,
                             response_format=os.getenv("GROQ_TTS_FORMAT", "wav"),
-                        )
-                        await websocket.send_text(json.dumps({
-                            "type": "assistant_audio",
-                            "audio_format": mime,
-                        }))
-                        if audio_bytes:
-                            await websocket.send_bytes(audio_bytes)
+                        ))
+                        await proto.send_audio(websocket, mime, audio_bytes)
                     except Exception as e:
                         if "RATE_LIMIT_EXCEEDED" in str(e):
-                            await websocket.send_text(json.dumps({
+                            await proto.send(websocket, {
                                 "type": "rate_limit_error",
                                 "message": "Text-to-speech rate limit reached. UPI ₹249 to 7774910883"
-                            }))
+                            })
                             print("[Groq TTS] Rate limit reached (greeting)")
                             continue
                         print("[Groq TTS] error (greeting):", e)
                         # Fallback to default voice once
                         try:
-                            audio_bytes, mime = await synthesize_tts(
+                            audio_bytes, mime = await recorder.stage("tts", synthesize_tts(
                                 tts_client,
                                 greeting,
                                 model=tts_model,
                                 voice=DEFAULT_TTS_VOICE,
                                 response_format=os.getenv("GROQ_TTS_FORMAT", "wav"),
-                            )
-                            await websocket.send_text(json.dumps({
-                                "type": "assistant_audio",
-                                "audio_format": mime,
-                            }))
-                            if audio_bytes:
-                                await websocket.send_bytes(audio_bytes)
+                            ))
+                            await proto.send_audio(websocket, mime, audio_bytes)
                         except Exception as e2:
                             print("[Groq TTS] fallback error (greeting):", e2)
                     
                     continue
 
                 if msg_type in ("segment_end", "flush"):
+                    turn_start = time.perf_counter()
                     # 1) STT
                     transcript = ""
                     if groq_client and len(audio_buffer) > 0:
-                        transcript = await transcribe_webm_bytes(groq_client, bytes(audio_buffer), GROQ_STT_MODEL)
+                        audio_data, audio_suffix = await recorder.stage("preprocess", preprocess_audio(bytes(audio_buffer)))
+                        transcript = await recorder.stage("stt", transcribe_webm_bytes(groq_client, audio_data, GROQ_STT_MODEL, suffix=audio_suffix))
                     if not transcript:
                         transcript = "(couldn't transcribe)"
 
                     history.append({"role": "user", "content": transcript})
 
                     # 2) LLM reply (non-streaming for now) - pass interview context
-                    reply_text = await generate_reply(groq_client, history, GROQ_LLM_MODEL, interview_context)
+                    reply_text = await recorder.stage("llm", generate_reply(groq_client, history, GROQ_LLM_MODEL, interview_context))
                     history.append({"role": "assistant", "content": reply_text})
 
                     # Send assistant text first so UI can show live transcript under interviewer circle
-                    await websocket.send_text(json.dumps({
+                    await proto.send(websocket, {
                         "type": "assistant_text",
                         "transcript": transcript,
                         "text": reply_text,
-                    }))
+                    })
 
                     # 3) TTS using Groq
                     try:
-                        audio_bytes, mime = await synthesize_tts(
+                        audio_bytes, mime = await recorder.stage("tts", synthesize_tts(
                             tts_client,
                             reply_text,
                             model=tts_model,
                             voice=tts_voice,
                             response_format=os.getenv("GROQ_TTS_FORMAT", "wav"),
-                        )
+                        ))
                     except Exception as e:
                         if "RATE_LIMIT_EXCEEDED" in str(e):
-                            await websocket.send_text(json.dumps({
+                            await proto.send(websocket, {
                                 "type": "rate_limit_error",
                                 "message": "Text-to-speech rate limit reached. UPI ₹249 to 7774910883"
-                            }))
+                            })
                             print("[Groq TTS] Rate limit reached (reply)")
                             audio_buffer.clear()
                             continue
                         print("[Groq TTS] error (reply):", e)
                         # Fallback to default voice once
                         try:
-                            audio_bytes, mime = await synthesize_tts(
+                            audio_bytes, mime = await recorder.stage("tts", synthesize_tts(
                                 tts_client,
                                 reply_text,
                                 model=tts_model,
                                 voice=DEFAULT_TTS_VOICE,
                                 response_format=os.getenv("GROQ_TTS_FORMAT", "wav"),
-                            )
+                            ))
                         except Exception as e2:
                             if "RATE_LIMIT_EXCEEDED" in str(e2):
-                                await websocket.send_text(json.dumps({
+                                await proto.send(websocket, {
                                     "type": "rate_limit_error",
                                     "message": "Text-to-speech rate limit reached. UPI ₹249 to 7774910883"
-                                }))
+                                })
                                 print("[Groq TTS] Rate limit reached (fallback reply)")
                                 audio_buffer.clear()
                                 continue
                             print("[Groq TTS] fallback error (reply):", e2)
                             audio_bytes, mime = b"", "audio/wav"
 
-                    await websocket.send_text(json.dumps({
-                        "type": "assistant_audio",
-                        "audio_format": mime,
-                    }))
-                    if audio_bytes:
-                        await websocket.send_bytes(audio_bytes)
+                    await proto.send_audio(websocket, mime, audio_bytes)
 
                     audio_buffer.clear()
+                    recorder.timings.add("turn", time.perf_counter() - turn_start)
 
                 elif msg_type == "end_call":
                     # Evaluate the conversation and send results
-                    evaluation = await evaluate_conversation(get_groq_client(), history, GROQ_LLM_MODEL)
-                    await websocket.send_text(json.dumps({
+                    evaluation = await recorder.stage("evaluate", evaluate_conversation(get_groq_client(), history, GROQ_LLM_MODEL))
+                    await proto.send(websocket, {
                         "type": "evaluation",
                         "result": evaluation,
-                    }))
+                    })
                     # Then close cleanly
                     await websocket.close()
                     print("👋 Client disconnected (end call)")
@@ -211,4 +212,8 @@ async def interview_socket(websocket: WebSocket):
             await websocket.close()
         except Exception:
             pass
+        record_route_timing("WS /ws/interview", time.perf_counter() - session_start)
+        merge_route_timings("WS /ws/interview", recorder.timings)
+        print("⏱️ Session timings:", recorder.timings.summary())
+        recorder.close()
         print("👋 Client disconnected")
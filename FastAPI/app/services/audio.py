@@ -0,0 +1,73 @@
+import asyncio
+import os
+from typing import List, Tuple
+
+# Optional normalization stage between the websocket audio buffer and STT.
+# MediaRecorder typically hands us 48 kHz stereo Opus; Whisper only needs 16 kHz mono,
+# so downmixing/resampling before upload shrinks the request considerably.
+# Settings are read per call so values from .env (loaded in app.main) apply.
+
+
+def preprocess_enabled() -> bool:
+    return os.getenv("AUDIO_PREPROCESS", "0").lower() in ("1", "true", "yes")
+
+
+def ffmpeg_args(sample_rate: int = None, bitrate: str = None) -> List[str]:
+    """ffmpeg command that decodes stdin, downmixes to mono, resamples and writes Ogg/Opus to stdout."""
+    sample_rate = sample_rate or int(os.getenv("AUDIO_SAMPLE_RATE", "16000"))
+    bitrate = bitrate or os.getenv("AUDIO_BITRATE", "24k")
+    return [
+        os.getenv("FFMPEG_BIN", "ffmpeg"), "-hide_banner", "-loglevel", "error",
+        "-i", "pipe:0",
+        "-ac", "1",
+        "-ar", str(sample_rate),
+        "-c:a", "libopus",
+        "-b:a", bitrate,
+        "-application", "voip",
+        "-f", "ogg",
+        "pipe:1",
+    ]
+
+
+async def normalize_audio(data: bytes, sample_rate: int = None, bitrate: str = None, timeout: float = None) -> bytes:
+    """
+    Decode, downmix to mono, resample and re-encode as Ogg/Opus.
+    Runs ffmpeg as a child process over pipes, so the event loop is never blocked. Raises on failure;
+    the child is killed if it exceeds AUDIO_PREPROCESS_TIMEOUT seconds or the caller is cancelled.
+    """
+    if timeout is None:
+        try:
+            timeout = float(os.getenv("AUDIO_PREPROCESS_TIMEOUT", "5"))
+        except ValueError:
+            timeout = 5.0
+    proc = await asyncio.create_subprocess_exec(
+        *ffmpeg_args(sample_rate, bitrate),
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        out, err = await asyncio.wait_for(proc.communicate(data), timeout=timeout)
+    except BaseException:
+        # Timeout or cancellation: don't leave ffmpeg running
+        if proc.returncode is None:
+            proc.kill()
+            await proc.wait()
+        raise
+    if proc.returncode != 0 or not out:
+        raise RuntimeError(err.decode("utf-8", "replace").strip() or "ffmpeg produced no output")
+    return out
+
+
+async def preprocess_audio(data: bytes) -> Tuple[bytes, str]:
+    """
+    Returns (audio_bytes, file_suffix) ready for STT upload.
+    When preprocessing is disabled or fails, the original webm bytes are passed through.
+    """
+    if not preprocess_enabled() or not data:
+        return data, ".webm"
+    try:
+        return await normalize_audio(data), ".ogg"
+    except Exception as e:
+        print("[Audio] preprocess error, uploading original:", e)
+        return data, ".webm"
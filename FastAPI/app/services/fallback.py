@@ -0,0 +1,142 @@
+import json
+import os
+import re
+import tempfile
+import threading
+from typing import List, Dict, Any, Tuple
+
+# Local interviewer used when the LLM is unavailable, rate-limited or too slow.
+# Questions are indexed by (role, difficulty) and seeded from /interviews/generate output,
+# optionally persisted to FALLBACK_QUESTIONS_PATH so they survive restarts and are shared
+# between workers (each save re-reads the file and merges before replacing it).
+
+DEFAULT_QUESTIONS = [
+    "Can you walk me through a recent project you are proud of and your role in it?",
+    "What was the hardest technical problem you have solved, and how did you approach it?",
+    "How do you make sure the code you ship is correct and maintainable?",
+    "Tell me about a time you had to make a trade-off between speed and quality.",
+    "How would you debug an issue that only happens in production?",
+    "How do you keep your technical skills up to date?",
+]
+LAST_RESORT_REPLY = "Can you elaborate more on your approach?"
+
+_bank: Dict[Tuple[str, str], List[str]] = {}
+_loaded_path = None
+_lock = threading.RLock()
+
+
+def _bank_path() -> str:
+    return os.getenv("FALLBACK_QUESTIONS_PATH", "")
+
+
+def _key(role: str, difficulty: str) -> Tuple[str, str]:
+    return ((role or "").strip().lower(), (difficulty or "").strip().lower())
+
+
+def _norm(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", " ", (text or "").lower()).strip()
+
+
+def _merge(bank: Dict[Tuple[str, str], List[str]], key: Tuple[str, str], questions: List[str]):
+    bucket = bank.setdefault(key, [])
+    seen = {_norm(q) for q in bucket}
+    for q in questions:
+        if isinstance(q, str) and q.strip() and _norm(q) not in seen:
+            bucket.append(q.strip())
+            seen.add(_norm(q))
+
+
+def _read_file(path: str) -> Dict[Tuple[str, str], List[str]]:
+    bank: Dict[Tuple[str, str], List[str]] = {}
+    if not path or not os.path.exists(path):
+        return bank
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        for entry in data if isinstance(data, list) else []:
+            if isinstance(entry, dict) and isinstance(entry.get("questions"), list):
+                _merge(bank, _key(entry.get("role"), entry.get("difficulty")), entry["questions"])
+    except Exception as e:
+        print("[Fallback] failed to load question bank:", e)
+    return bank
+
+
+def _load():
+    global _loaded_path
+    path = _bank_path()
+    if _loaded_path == path:
+        return
+    with _lock:
+        if _loaded_path == path:
+            return
+        for key, questions in _read_file(path).items():
+            _merge(_bank, key, questions)
+        # Only mark as loaded once the bank is populated
+        _loaded_path = path
+
+
+def load_question_bank():
+    """Read FALLBACK_QUESTIONS_PATH into memory. Blocking I/O; called off the loop at startup."""
+    _load()
+
+
+def _save():
+    """Merge with what other workers wrote, then atomically replace the file. Blocking I/O."""
+    path = _bank_path()
+    if not path:
+        return
+    try:
+        for key, questions in _read_file(path).items():
+            _merge(_bank, key, questions)
+        data = [{"role": r, "difficulty": d, "questions": q} for (r, d), q in _bank.items()]
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+    except Exception as e:
+        print("[Fallback] failed to save question bank:", e)
+
+
+def seed_questions(role: str, difficulty: str, generated: Any):
+    """
+    Add questions from a /interviews/generate payload to the bank for (role, difficulty).
+    Does blocking file I/O when FALLBACK_QUESTIONS_PATH is set; call it off the event loop.
+    """
+    if not isinstance(generated, dict) or not isinstance(generated.get("questions"), list):
+        return
+    questions = []
+    for q in generated["questions"]:
+        text = q.get("question") if isinstance(q, dict) else q
+        if isinstance(text, str) and text.strip():
+            questions.append(text.strip())
+    if not questions:
+        return
+    with _lock:
+        _load()
+        _merge(_bank, _key(role, difficulty), questions)
+        _save()
+
+
+def fallback_reply(history: List[Dict[str, Any]], interview_context: Dict[str, Any] = None) -> str:
+    """
+    Pick the next question for this role/difficulty that has not been asked yet in history.
+    Only touches memory once the bank has been loaded at startup (see load_question_bank).
+    """
+    _load()
+    ctx = interview_context or {}
+    role, difficulty = _key(ctx.get("role", ""), ctx.get("difficulty", ""))
+    candidates = list(_bank.get((role, difficulty), []))
+    for (r, d), questions in list(_bank.items()):
+        if r == role and d != difficulty:
+            candidates.extend(questions)
+    candidates.extend(DEFAULT_QUESTIONS)
+
+    asked = {_norm(h.get("content", "")) for h in history if h.get("role") == "assistant"}
+    for q in candidates:
+        if _norm(q) not in asked:
+            return q
+    return LAST_RESORT_REPLY
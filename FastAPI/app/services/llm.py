@@ -1,9 +1,22 @@
+import asyncio
+import os
 from typing import List, Dict, Any
 
+from .fallback import fallback_reply
+
+# Per-turn latency budget for the LLM call; past this we answer from the local question bank
+DEFAULT_LLM_TURN_BUDGET = "4.0"
+
 
 async def generate_reply(groq_client, history: List[Dict[str, Any]], model: str, interview_context: Dict[str, Any] = None) -> str:
+    try:
+        budget = float(os.getenv("LLM_TURN_BUDGET", DEFAULT_LLM_TURN_BUDGET))
+    except ValueError:
+        print("[LLM] invalid LLM_TURN_BUDGET, using default")
+        budget = float(DEFAULT_LLM_TURN_BUDGET)
     if not groq_client:
-        return "Please configure GROQ_API_KEY on the server."
+        print("[LLM] GROQ_API_KEY not configured, using fallback interviewer")
+        return fallback_reply(history, interview_context)
     try:
         # Build system prompt with interview context
         system_prompt = (
@@ -46,16 +59,27 @@ async def generate_reply(groq_client, history: List[Dict[str, Any]], model: str,
         for h in history[-10:]:
             messages.append({"role": h["role"], "content": h["content"]})
 
-        llm = groq_client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=0.6,
-            max_tokens=160,
+        # Bound the upstream call itself (no retries, SDK timeout = budget) so timed-out
+        # requests don't keep running and pile up in the default thread pool
+        llm = await asyncio.wait_for(
+            asyncio.to_thread(
+                groq_client.with_options(max_retries=0, timeout=budget).chat.completions.create,
+                model=model,
+                messages=messages,
+                temperature=0.6,
+                max_tokens=160,
+            ),
+            timeout=budget,
         )
         
         response = (llm.choices[0].message.content or "").strip()
+        if not response:
+            return fallback_reply(history, interview_context)
         print(f"💬 AI Response: {response}")
         return response
+    except asyncio.TimeoutError:
+        print(f"[LLM] exceeded {budget}s turn budget, using fallback interviewer")
+        return fallback_reply(history, interview_context)
     except Exception as e:
-        print("[LLM] error:", e)
-        return "Can you elaborate more on your approach?"
+        print("[LLM] error, using fallback interviewer:", e)
+        return fallback_reply(history, interview_context)
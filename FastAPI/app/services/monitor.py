@@ -0,0 +1,140 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from typing import Dict, Any
+
+# Runtime instrumentation: event-loop lag watchdog, sampling profiler and stage/route timings.
+# LOOP_LAG_THRESHOLD (seconds, default 0.25) and LOOP_LAG_INTERVAL (heartbeat period, default 0.05)
+# are read when the watchdog starts.
+
+_heartbeat_task = None
+_watchdog_stop = None
+_route_timings: Dict[str, Dict[str, float]] = {}
+_timings_lock = threading.Lock()
+
+
+class StageTimings:
+    """Accumulated count/total/max seconds per stage name."""
+
+    def __init__(self):
+        self.stages: Dict[str, Dict[str, float]] = {}
+
+    def add(self, name: str, seconds: float):
+        s = self.stages.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+        s["count"] += 1
+        s["total"] += seconds
+        s["max"] = max(s["max"], seconds)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {
+            name: {
+                "count": int(s["count"]),
+                "avg_ms": round(s["total"] / s["count"] * 1000, 1),
+                "max_ms": round(s["max"] * 1000, 1),
+            }
+            for name, s in self.stages.items()
+        }
+
+
+def record_route_timing(name: str, seconds: float):
+    with _timings_lock:
+        s = _route_timings.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0})
+        s["count"] += 1
+        s["total"] += seconds
+        s["max"] = max(s["max"], seconds)
+
+
+def merge_route_timings(prefix: str, timings: StageTimings):
+    """Fold a session's per-call stage samples (count/total/max) into the worker-wide aggregate."""
+    with _timings_lock:
+        for name, stat in timings.stages.items():
+            s = _route_timings.setdefault(f"{prefix}:{name}", {"count": 0, "total": 0.0, "max": 0.0})
+            s["count"] += stat["count"]
+            s["total"] += stat["total"]
+            s["max"] = max(s["max"], stat["max"])
+
+
+def route_timings() -> Dict[str, Any]:
+    with _timings_lock:
+        t = StageTimings()
+        t.stages = {k: dict(v) for k, v in _route_timings.items()}
+    return t.summary()
+
+
+def start_loop_watchdog():
+    """
+    Start a heartbeat task on the running loop plus a watcher thread. If the heartbeat
+    stalls for longer than LOOP_LAG_THRESHOLD, the watcher logs the loop thread's stack
+    once per stall, pointing at whatever is blocking.
+    """
+    global _heartbeat_task, _watchdog_stop
+    threshold = float(os.getenv("LOOP_LAG_THRESHOLD", "0.25"))
+    interval = float(os.getenv("LOOP_LAG_INTERVAL", "0.05"))
+    if _heartbeat_task is not None or threshold <= 0:
+        return
+
+    loop_thread_id = threading.get_ident()
+    state = {"beat": time.perf_counter()}
+
+    async def heartbeat():
+        while True:
+            state["beat"] = time.perf_counter()
+            await asyncio.sleep(interval)
+
+    def watch(stop: threading.Event):
+        reported = None
+        while not stop.wait(interval):
+            beat = state["beat"]
+            lag = time.perf_counter() - beat
+            if lag < threshold or reported == beat:
+                continue
+            reported = beat
+            frame = sys._current_frames().get(loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame else "(no frame)"
+            print(f"[Monitor] event loop blocked for {lag * 1000:.0f} ms:\n{stack}")
+
+    _watchdog_stop = threading.Event()
+    _heartbeat_task = asyncio.get_running_loop().create_task(heartbeat())
+    threading.Thread(target=watch, args=(_watchdog_stop,), name="loop-watchdog", daemon=True).start()
+
+
+def stop_loop_watchdog():
+    global _heartbeat_task, _watchdog_stop
+    if _heartbeat_task is not None:
+        _heartbeat_task.cancel()
+        _heartbeat_task = None
+    if _watchdog_stop is not None:
+        _watchdog_stop.set()
+        _watchdog_stop = None
+
+
+def _fold(frame) -> str:
+    parts = []
+    while frame is not None:
+        code = frame.f_code
+        parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+def sample_profile(seconds: float, interval: float = 0.005) -> str:
+    """
+    Sample every thread's stack for `seconds` and return collapsed stacks
+    ("frame;frame;frame count" per line) for flamegraph.pl / speedscope.
+    Call from a worker thread so the event loop keeps running while sampled.
+    """
+    own = threading.get_ident()
+    names = {t.ident: t.name for t in threading.enumerate()}
+    counts: Counter = Counter()
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own:
+                continue
+            counts[f"{names.get(thread_id, thread_id)};{_fold(frame)}"] += 1
+        time.sleep(max(0.0, min(interval, deadline - time.perf_counter())))
+    return "\n".join(f"{stack} {n}" for stack, n in counts.most_common())
@@ -0,0 +1,83 @@
+import json
+import struct
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # optional, falls back to stdlib json
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # optional, parakh.v2.msgpack is only offered when installed
+    msgpack = None
+
+# Server -> client framing, negotiated through the WebSocket subprotocol header.
+# Client -> server traffic is unchanged in every version (JSON text control, binary audio).
+#
+#   (none)              v1: JSON text frames; audio is an "assistant_audio" text frame
+#                           followed by a separate binary frame
+#   parakh.v2.json      JSON text frames (orjson when available); audio is ONE binary frame:
+#                           >I header length | JSON header | audio bytes
+#   parakh.v2.msgpack   every message is a binary MessagePack map; audio carries an
+#                           "audio" bytes field in the same map
+SUBPROTOCOL_JSON = "parakh.v2.json"
+SUBPROTOCOL_MSGPACK = "parakh.v2.msgpack"
+
+_LEN = struct.Struct(">I")
+
+
+def dumps(obj: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, separators=(",", ":"))
+
+
+class ProtocolV1:
+    subprotocol = None
+
+    async def send(self, websocket, obj: Dict[str, Any]):
+        await websocket.send_text(json.dumps(obj))
+
+    async def send_audio(self, websocket, mime: str, audio_bytes: bytes):
+        await websocket.send_text(json.dumps({
+            "type": "assistant_audio",
+            "audio_format": mime,
+        }))
+        if audio_bytes:
+            await websocket.send_bytes(audio_bytes)
+
+
+class ProtocolV2Json(ProtocolV1):
+    subprotocol = SUBPROTOCOL_JSON
+
+    async def send(self, websocket, obj: Dict[str, Any]):
+        await websocket.send_text(dumps(obj))
+
+    async def send_audio(self, websocket, mime: str, audio_bytes: bytes):
+        header = dumps({"type": "assistant_audio", "audio_format": mime}).encode("utf-8")
+        await websocket.send_bytes(_LEN.pack(len(header)) + header + (audio_bytes or b""))
+
+
+class ProtocolV2Msgpack(ProtocolV1):
+    subprotocol = SUBPROTOCOL_MSGPACK
+
+    async def send(self, websocket, obj: Dict[str, Any]):
+        await websocket.send_bytes(msgpack.packb(obj, use_bin_type=True))
+
+    async def send_audio(self, websocket, mime: str, audio_bytes: bytes):
+        await websocket.send_bytes(msgpack.packb({
+            "type": "assistant_audio",
+            "audio_format": mime,
+            "audio": audio_bytes or b"",
+        }, use_bin_type=True))
+
+
+def negotiate(requested: Optional[List[str]]) -> Tuple[Optional[str], ProtocolV1]:
+    """Pick the first supported protocol in the client's preference order; otherwise v1."""
+    for name in requested or []:
+        if name == SUBPROTOCOL_MSGPACK and msgpack is not None:
+            return name, ProtocolV2Msgpack()
+        if name == SUBPROTOCOL_JSON:
+            return name, ProtocolV2Json()
+    return None, ProtocolV1()
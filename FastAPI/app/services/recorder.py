@@ -0,0 +1,163 @@
+import json
+import os
+import struct
+import time
+import uuid
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+from .monitor import StageTimings
+
+# Opt-in session recorder. Each interview is written to SESSION_RECORD_DIR as an
+# append-only log of framed records:
+#   >II header (meta length, payload length) | JSON meta | raw payload bytes
+# Meta always carries "t" (seconds since session start) and "kind":
+#   session - negotiated WebSocket subprotocol (None for v1)
+#   in      - client frame (text in meta, or "bin": true with the audio bytes in payload)
+#   out     - server frame (text in meta, binary frames only record their size)
+#   stage   - provider call (preprocess/stt/llm/tts/evaluate) with latency and result or error
+#   timings - per-stage summary written when the session closes
+#
+# Records are written synchronously from the event loop. The file uses a 1 MiB buffer so most
+# writes only copy into memory, but a flush can still stall the loop on slow disks; keep
+# SESSION_RECORD_DIR on local storage and leave recording off in latency-sensitive deployments.
+
+_HEADER = struct.Struct(">II")
+
+
+class SessionRecorder:
+    def __init__(self, path: str):
+        self.path = path
+        self._start = time.perf_counter()
+        self._file = open(path, "ab", buffering=1 << 20)
+        self.timings = StageTimings()
+
+    def now(self) -> float:
+        return time.perf_counter() - self._start
+
+    def event(self, kind: str, meta: Dict[str, Any] = None, payload: bytes = b""):
+        record = {"t": round(self.now(), 6), "kind": kind}
+        if meta:
+            record.update(meta)
+        raw = json.dumps(record, separators=(",", ":")).encode("utf-8")
+        self._file.write(_HEADER.pack(len(raw), len(payload)))
+        self._file.write(raw)
+        if payload:
+            self._file.write(payload)
+
+    async def stage(self, name: str, coro):
+        """Await a provider call, recording its latency and a summary of the result."""
+        t0 = time.perf_counter()
+        try:
+            result = await coro
+        except Exception as e:
+            latency = time.perf_counter() - t0
+            self.timings.add(name, latency)
+            self.event("stage", {"stage": name, "latency": round(latency, 6), "error": str(e)})
+            raise
+        latency = time.perf_counter() - t0
+        self.timings.add(name, latency)
+        meta = {"stage": name, "latency": round(latency, 6)}
+        if name == "tts":
+            audio_bytes, mime = result
+            meta.update({"mime": mime, "size": len(audio_bytes or b"")})
+        elif name == "preprocess":
+            audio_bytes, suffix = result
+            meta.update({"suffix": suffix, "size": len(audio_bytes or b"")})
+        else:
+            meta["result"] = result
+        self.event("stage", meta)
+        return result
+
+    def wrap(self, websocket):
+        return RecordingWebSocket(websocket, self)
+
+    def close(self):
+        try:
+            self.event("timings", {"stages": self.timings.summary()})
+            self._file.close()
+        except Exception:
+            pass
+
+
+class NullRecorder:
+    """Used when recording is disabled; stages are only timed."""
+
+    def __init__(self):
+        self.timings = StageTimings()
+
+    def event(self, kind: str, meta: Dict[str, Any] = None, payload: bytes = b""):
+        pass
+
+    async def stage(self, name: str, coro):
+        t0 = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            self.timings.add(name, time.perf_counter() - t0)
+
+    def wrap(self, websocket):
+        return websocket
+
+    def close(self):
+        pass
+
+
+class RecordingWebSocket:
+    """Thin proxy over a WebSocket that logs every frame in and out."""
+
+    def __init__(self, websocket, recorder: SessionRecorder):
+        self._ws = websocket
+        self._recorder = recorder
+
+    async def receive(self):
+        message = await self._ws.receive()
+        if message.get("bytes") is not None:
+            self._recorder.event("in", {"bin": True}, payload=message["bytes"])
+        elif message.get("text") is not None:
+            self._recorder.event("in", {"text": message["text"]})
+        return message
+
+    async def send_text(self, data: str):
+        self._recorder.event("out", {"text": data})
+        await self._ws.send_text(data)
+
+    async def send_bytes(self, data: bytes):
+        self._recorder.event("out", {"size": len(data)})
+        await self._ws.send_bytes(data)
+
+    def __getattr__(self, name):
+        return getattr(self._ws, name)
+
+
+def get_session_recorder():
+    record_dir = os.getenv("SESSION_RECORD_DIR", "")
+    if not record_dir:
+        return NullRecorder()
+    try:
+        os.makedirs(record_dir, exist_ok=True)
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.plog"
+        path = os.path.join(record_dir, name)
+        print(f"[Recorder] recording session to {path}")
+        return SessionRecorder(path)
+    except Exception as e:
+        print("[Recorder] disabled, could not open log:", e)
+        return NullRecorder()
+
+
+def read_session_log(path: str) -> Iterator[Tuple[Dict[str, Any], Optional[bytes]]]:
+    """
+    Yield (meta, payload) records from a session log, stopping at a truncated tail.
+    payload is None for records without binary data and bytes (possibly empty) for binary frames.
+    """
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return
+            meta_len, payload_len = _HEADER.unpack(header)
+            raw = f.read(meta_len)
+            payload = f.read(payload_len)
+            if len(raw) < meta_len or len(payload) < payload_len:
+                return
+            meta = json.loads(raw)
+            yield meta, payload if (payload_len or meta.get("bin")) else None
@@ -2,12 +2,12 @@ import os
 from tempfile import NamedTemporaryFile
 
 
-async def transcribe_webm_bytes(groq_client, data: bytes, model: str) -> str:
+async def transcribe_webm_bytes(groq_client, data: bytes, model: str, suffix: str = ".webm") -> str:
     if not groq_client or not data:
         return ""
     tmp_path = None
     try:
-        with NamedTemporaryFile(delete=False, suffix=".webm") as tmp:
+        with NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
             tmp.write(data)
             tmp_path = tmp.name
         with open(tmp_path, "rb") as f:
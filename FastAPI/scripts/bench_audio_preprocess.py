@@ -0,0 +1,99 @@
+"""
+Benchmark the optional audio normalization stage in front of STT.
+
+Usage (from the FastAPI directory):
+    python scripts/bench_audio_preprocess.py path/to/recording.webm [--runs 5]
+
+Reports upload bytes, CPU seconds spent per second of audio, and (when GROQ_API_KEY
+is set) end-to-end STT latency with and without the stage.
+"""
+import argparse
+import asyncio
+import os
+import resource
+import subprocess
+import sys
+import time
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv  # noqa: E402
+
+from app.services.audio import normalize_audio  # noqa: E402
+from app.services.groq_client import get_groq_client, GROQ_STT_MODEL  # noqa: E402
+from app.services.stt import transcribe_webm_bytes  # noqa: E402
+
+
+def audio_duration(data: bytes) -> Optional[float]:
+    """Duration in seconds via ffprobe, or None when the container doesn't say (e.g. MediaRecorder webm)."""
+    ffmpeg = os.getenv("FFMPEG_BIN", "ffmpeg")
+    ffprobe = os.path.join(os.path.dirname(ffmpeg), "ffprobe") if os.path.dirname(ffmpeg) else "ffprobe"
+    try:
+        out = subprocess.run(
+            [ffprobe, "-v", "error", "-show_entries", "format=duration", "-of", "csv=p=0", "pipe:0"],
+            input=data,
+            stdout=subprocess.PIPE,
+            check=True,
+        )
+        duration = float(out.stdout.decode().strip())
+    except (subprocess.CalledProcessError, OSError, ValueError):
+        return None
+    return duration if duration > 0 else None
+
+
+def children_cpu() -> float:
+    ru = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return ru.ru_utime + ru.ru_stime
+
+
+async def stt_latency(client, data: bytes, suffix: str, runs: int) -> float:
+    total = 0.0
+    for _ in range(runs):
+        t0 = time.perf_counter()
+        await transcribe_webm_bytes(client, data, GROQ_STT_MODEL, suffix=suffix)
+        total += time.perf_counter() - t0
+    return total / runs
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with open(args.path, "rb") as f:
+        raw = f.read()
+
+    cpu0 = children_cpu()
+    t0 = time.perf_counter()
+    for _ in range(args.runs):
+        normalized = asyncio.run(normalize_audio(raw))
+    wall = (time.perf_counter() - t0) / args.runs
+    cpu = (children_cpu() - cpu0) / args.runs
+
+    # Browser webm usually has no duration header; the normalized Ogg does
+    duration = audio_duration(raw) or audio_duration(normalized)
+    if duration:
+        print(f"audio duration      : {duration:.2f}s")
+    else:
+        print("audio duration      : unknown (skipping CPU per second of audio)")
+    print(f"upload bytes (raw)  : {len(raw)}")
+    print(f"upload bytes (norm) : {len(normalized)} ({len(normalized) / max(1, len(raw)):.1%})")
+    print(f"normalize wall      : {wall * 1000:.1f} ms")
+    if duration:
+        print(f"normalize CPU/s     : {cpu / duration * 1000:.1f} ms per second of audio")
+
+    client = get_groq_client()
+    if not client:
+        print("GROQ_API_KEY not set; skipping STT latency")
+        return
+    base = asyncio.run(stt_latency(client, raw, ".webm", args.runs))
+    norm = asyncio.run(stt_latency(client, normalized, ".ogg", args.runs))
+    print(f"STT latency (raw)   : {base * 1000:.0f} ms")
+    print(f"STT latency (norm)  : {(norm + wall) * 1000:.0f} ms incl. normalize")
+
+
+if __name__ == "__main__":
+    main()
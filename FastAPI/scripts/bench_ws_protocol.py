@@ -0,0 +1,94 @@
+"""
+Benchmark server->client framing for each WebSocket protocol version.
+
+Usage (from the FastAPI directory):
+    python scripts/bench_ws_protocol.py [--sessions 200] [--turns 10] [--audio-kb 150]
+
+Encodes a synthetic interview per session (greeting, N reply turns with text + audio,
+and a large evaluation payload) into an in-memory socket and reports frames/sec,
+bytes per session and CPU per session. Network and permessage-deflate costs are excluded.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services import protocol  # noqa: E402
+
+
+class CountingSocket:
+    def __init__(self):
+        self.frames = 0
+        self.bytes = 0
+
+    async def send_text(self, data: str):
+        self.frames += 1
+        self.bytes += len(data.encode("utf-8"))
+
+    async def send_bytes(self, data: bytes):
+        self.frames += 1
+        self.bytes += len(data)
+
+
+def make_evaluation():
+    return {
+        "overall_score": 72,
+        "strengths": [f"Strength {i}: clear explanation of trade-offs in design {i}" for i in range(20)],
+        "areas_for_improvement": [f"Improve depth on topic {i} with concrete examples" for i in range(20)],
+        "brief_summary": "The candidate communicated clearly. " * 40,
+        "turns": [{"question": f"Question {i}?" * 5, "answer": "Answer text " * 30, "score": i} for i in range(30)],
+    }
+
+
+async def run_session(proto, ws, turns: int, audio: bytes, evaluation):
+    await proto.send(ws, {"type": "assistant_text", "transcript": "", "text": "Hello! Tell me about yourself."})
+    await proto.send_audio(ws, "audio/wav", audio)
+    for i in range(turns):
+        await proto.send(ws, {
+            "type": "assistant_text",
+            "transcript": f"Candidate answer number {i} " * 8,
+            "text": "Can you walk me through how you would scale that service?",
+        })
+        await proto.send_audio(ws, "audio/wav", audio)
+    await proto.send(ws, {"type": "evaluation", "result": evaluation})
+
+
+async def bench(name, proto, sessions: int, turns: int, audio: bytes):
+    evaluation = make_evaluation()
+    total_frames = total_bytes = 0
+    cpu0, wall0 = time.process_time(), time.perf_counter()
+    for _ in range(sessions):
+        ws = CountingSocket()
+        await run_session(proto, ws, turns, audio, evaluation)
+        total_frames += ws.frames
+        total_bytes += ws.bytes
+    cpu, wall = time.process_time() - cpu0, time.perf_counter() - wall0
+    print(
+        f"{name:<18} frames/session={total_frames // sessions:<4} "
+        f"bytes/session={total_bytes // sessions:<9} "
+        f"frames/sec={total_frames / wall:>10.0f} "
+        f"CPU/session={cpu / sessions * 1e6:>8.1f} us"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--audio-kb", type=int, default=150)
+    args = parser.parse_args()
+
+    audio = os.urandom(args.audio_kb * 1024)
+    print(f"orjson: {'yes' if protocol.orjson else 'no'}, msgpack: {'yes' if protocol.msgpack else 'no'}")
+    versions = [("v1", protocol.ProtocolV1()), (protocol.SUBPROTOCOL_JSON, protocol.ProtocolV2Json())]
+    if protocol.msgpack is not None:
+        versions.append((protocol.SUBPROTOCOL_MSGPACK, protocol.ProtocolV2Msgpack()))
+    for name, proto in versions:
+        asyncio.run(bench(name, proto, args.sessions, args.turns, audio))
+
+
+if __name__ == "__main__":
+    main()
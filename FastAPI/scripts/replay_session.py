@@ -0,0 +1,140 @@
+"""
+Replay a recorded interview session against the WebSocket route with stubbed providers.
+
+Usage (from the FastAPI directory):
+    python scripts/replay_session.py recordings/20261019-101500-abcd1234.plog [--speed 4] [--no-provider-delay]
+
+Client frames are sent at their original offsets divided by --speed. Audio preprocessing and
+STT/LLM/TTS/evaluation calls are answered from the log, sleeping for the recorded latency (also
+scaled by --speed) unless --no-provider-delay is given; ffmpeg never runs, whatever AUDIO_PREPROCESS
+says. Prints per-turn latency, recorded vs replayed.
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import defaultdict, deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+from app.routes import ws as ws_route  # noqa: E402
+from app.services.recorder import NullRecorder, read_session_log  # noqa: E402
+
+
+def load_session(path: str):
+    """Split a log into client frames grouped by turn, per-stage provider responses and the subprotocol."""
+    subprotocol = None
+    turns = []      # [{"t", "frames": [(meta, payload)], "outputs", "latency"}]
+    stages = defaultdict(deque)
+    current = None
+    for meta, payload in read_session_log(path):
+        kind = meta["kind"]
+        if kind == "in":
+            # A turn starts with a control frame; audio frames attach to the next one
+            if current is None or current["outputs"]:
+                current = {"t": meta["t"], "frames": [], "outputs": 0, "latency": None}
+                turns.append(current)
+            current["frames"].append((meta, payload))
+            current["t"] = meta["t"]
+        elif kind == "out" and current is not None:
+            current["outputs"] += 1
+            current["latency"] = meta["t"] - current["t"]
+        elif kind == "stage":
+            stages[meta["stage"]].append(meta)
+        elif kind == "session":
+            subprotocol = meta.get("subprotocol")
+    return turns, stages, subprotocol
+
+
+def install_stubs(stages, delay_scale: float):
+    async def answer(stage: str):
+        meta = stages[stage].popleft() if stages[stage] else {}
+        if delay_scale:
+            await asyncio.sleep(meta.get("latency", 0) * delay_scale)
+        if "error" in meta:
+            raise Exception(meta["error"])
+        return meta
+
+    async def preprocess_audio(data):
+        if not stages["preprocess"]:
+            return data, ".webm"
+        meta = await answer("preprocess")
+        return b"\0" * meta.get("size", len(data)), meta.get("suffix", ".webm")
+
+    async def transcribe_webm_bytes(groq_client, data, model, suffix=".webm"):
+        return (await answer("stt")).get("result", "")
+
+    async def generate_reply(groq_client, history, model, interview_context=None):
+        return (await answer("llm")).get("result", "")
+
+    async def synthesize_tts(groq_client, text, model=None, voice=None, response_format="wav"):
+        meta = await answer("tts")
+        return b"\0" * meta.get("size", 0), meta.get("mime", f"audio/{response_format}")
+
+    async def evaluate_conversation(groq_client, history, model):
+        return (await answer("evaluate")).get("result", {})
+
+    stub_client = object()
+    ws_route.get_groq_client = lambda: stub_client
+    ws_route.get_groq_tts_client = lambda: stub_client
+    ws_route.preprocess_audio = preprocess_audio
+    ws_route.transcribe_webm_bytes = transcribe_webm_bytes
+    ws_route.generate_reply = generate_reply
+    ws_route.synthesize_tts = synthesize_tts
+    ws_route.evaluate_conversation = evaluate_conversation
+    ws_route.get_session_recorder = NullRecorder
+
+
+def replay(path: str, speed: float, provider_delay: bool):
+    turns, stages, subprotocol = load_session(path)
+    install_stubs(stages, (1.0 / speed) if provider_delay else 0.0)
+
+    results = []
+    with TestClient(app) as client, client.websocket_connect(
+        "/ws/interview", subprotocols=[subprotocol] if subprotocol else None
+    ) as ws:
+        # Frame counts per turn depend on the protocol; replaying under another one would hang
+        accepted = getattr(ws, "accepted_subprotocol", None)
+        if accepted != subprotocol:
+            raise SystemExit(
+                f"Recorded with subprotocol {subprotocol or 'v1'!r} but server negotiated {accepted or 'v1'!r} "
+                "(is the matching optional dependency installed?)"
+            )
+        start = time.perf_counter()
+        for i, turn in enumerate(turns):
+            for meta, payload in turn["frames"]:
+                wait = meta["t"] / speed - (time.perf_counter() - start)
+                if wait > 0:
+                    time.sleep(wait)
+                if payload is not None:
+                    ws.send_bytes(payload)
+                else:
+                    ws.send_text(meta.get("text", ""))
+            sent = time.perf_counter()
+            for _ in range(turn["outputs"]):
+                message = ws.receive()
+                if message.get("type") == "websocket.close":
+                    break
+            if turn["outputs"]:
+                results.append((i, turn["latency"], time.perf_counter() - sent))
+
+    print(f"{'turn':>4}  {'recorded ms':>12}  {'replayed ms':>12}")
+    for i, recorded, replayed in results:
+        print(f"{i:>4}  {recorded * 1000:>12.1f}  {replayed * 1000:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path")
+    parser.add_argument("--speed", type=float, default=1.0, help="timing acceleration factor")
+    parser.add_argument("--no-provider-delay", action="store_true", help="answer stubbed providers immediately")
+    args = parser.parse_args()
+    replay(args.path, max(args.speed, 1e-6), not args.no_provider_delay)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import asyncio
+import stat
+import sys
+import time
+
+import pytest
+
+from app.services import audio
+
+posix_only = pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as a fake ffmpeg")
+
+
+def _fake_ffmpeg(tmp_path, body):
+    script = tmp_path / "ffmpeg"
+    script.write_text("#!/bin/sh\n" + body + "\n")
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script)
+
+
+def test_ffmpeg_args(monkeypatch):
+    monkeypatch.setenv("FFMPEG_BIN", "/opt/ffmpeg/bin/ffmpeg")
+    monkeypatch.setenv("AUDIO_SAMPLE_RATE", "8000")
+    monkeypatch.delenv("AUDIO_BITRATE", raising=False)
+    args = audio.ffmpeg_args()
+    assert args[0] == "/opt/ffmpeg/bin/ffmpeg"
+    assert args[args.index("-i") + 1] == "pipe:0" and args[-1] == "pipe:1"
+    assert args[args.index("-ac") + 1] == "1"
+    assert args[args.index("-ar") + 1] == "8000"
+    assert args[args.index("-b:a") + 1] == "24k"
+    assert args[args.index("-f") + 1] == "ogg"
+    assert audio.ffmpeg_args(sample_rate=16000, bitrate="32k")[args.index("-ar") + 1] == "16000"
+
+
+def test_disabled_passes_through(monkeypatch):
+    monkeypatch.delenv("AUDIO_PREPROCESS", raising=False)
+
+    async def boom(*args, **kwargs):
+        raise AssertionError("ffmpeg must not run when preprocessing is disabled")
+
+    monkeypatch.setattr(audio.asyncio, "create_subprocess_exec", boom)
+    assert asyncio.run(audio.preprocess_audio(b"webm")) == (b"webm", ".webm")
+
+
+def test_missing_ffmpeg_falls_back_to_webm(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIO_PREPROCESS", "1")
+    monkeypatch.setenv("FFMPEG_BIN", str(tmp_path / "does-not-exist"))
+    assert asyncio.run(audio.preprocess_audio(b"webm")) == (b"webm", ".webm")
+
+
+@posix_only
+def test_normalized_output_is_used(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIO_PREPROCESS", "1")
+    monkeypatch.setenv("FFMPEG_BIN", _fake_ffmpeg(tmp_path, "cat >/dev/null; printf OggS"))
+    assert asyncio.run(audio.preprocess_audio(b"webm")) == (b"OggS", ".ogg")
+
+
+@posix_only
+def test_ffmpeg_failure_falls_back_to_webm(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIO_PREPROCESS", "1")
+    monkeypatch.setenv("FFMPEG_BIN", _fake_ffmpeg(tmp_path, "cat >/dev/null; echo bad input >&2; exit 1"))
+    assert asyncio.run(audio.preprocess_audio(b"webm")) == (b"webm", ".webm")
+
+
+@posix_only
+def test_stuck_ffmpeg_is_killed_on_timeout(monkeypatch, tmp_path):
+    monkeypatch.setenv("AUDIO_PREPROCESS", "1")
+    monkeypatch.setenv("AUDIO_PREPROCESS_TIMEOUT", "0.3")
+    monkeypatch.setenv("FFMPEG_BIN", _fake_ffmpeg(tmp_path, "exec sleep 30"))
+
+    procs = []
+    real_exec = asyncio.create_subprocess_exec
+
+    async def tracking_exec(*args, **kwargs):
+        proc = await real_exec(*args, **kwargs)
+        procs.append(proc)
+        return proc
+
+    monkeypatch.setattr(audio.asyncio, "create_subprocess_exec", tracking_exec)
+    t0 = time.perf_counter()
+    assert asyncio.run(audio.preprocess_audio(b"webm")) == (b"webm", ".webm")
+    assert time.perf_counter() - t0 < 5
+    assert procs and procs[0].returncode is not None
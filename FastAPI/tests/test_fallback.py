@@ -0,0 +1,131 @@
+import asyncio
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.services import fallback, llm
+
+
+@pytest.fixture(autouse=True)
+def fresh_bank(monkeypatch):
+    monkeypatch.delenv("FALLBACK_QUESTIONS_PATH", raising=False)
+    monkeypatch.setattr(fallback, "_bank", {})
+    monkeypatch.setattr(fallback, "_loaded_path", None)
+
+
+def _asked(*questions):
+    return [{"role": "assistant", "content": q} for q in questions]
+
+
+def test_skips_questions_already_in_history():
+    fallback.seed_questions("Backend", "Easy", {"questions": [{"question": "What is REST?"}, "Explain indexes."]})
+    ctx = {"role": "backend", "difficulty": "EASY"}
+    assert fallback.fallback_reply([], ctx) == "What is REST?"
+    # matching ignores case and punctuation
+    assert fallback.fallback_reply(_asked("what is rest"), ctx) == "Explain indexes."
+
+
+def test_falls_back_to_other_difficulty_then_defaults():
+    fallback.seed_questions("Backend", "Easy", {"questions": ["Easy Q?"]})
+    fallback.seed_questions("Backend", "Hard", {"questions": ["Hard Q?"]})
+    fallback.seed_questions("Frontend", "Hard", {"questions": ["Frontend Q?"]})
+    ctx = {"role": "Backend", "difficulty": "Hard"}
+    assert fallback.fallback_reply(_asked("Hard Q?"), ctx) == "Easy Q?"
+    assert fallback.fallback_reply(_asked("Hard Q?", "Easy Q?"), ctx) == fallback.DEFAULT_QUESTIONS[0]
+    assert fallback.fallback_reply(_asked("Hard Q?", "Easy Q?", *fallback.DEFAULT_QUESTIONS), ctx) == fallback.LAST_RESORT_REPLY
+
+
+@pytest.mark.parametrize("payload", [
+    None,
+    ["What is REST?"],
+    {"questions": "Explain CAP"},
+    {"questions": [{"question": 42}, "", {"topic": "no question"}]},
+    {"raw": "not json"},
+])
+def test_ignores_malformed_payloads(payload):
+    fallback.seed_questions("Backend", "Easy", payload)
+    assert fallback._bank == {}
+    assert fallback.fallback_reply([], {"role": "Backend", "difficulty": "Easy"}) == fallback.DEFAULT_QUESTIONS[0]
+
+
+def test_save_merges_with_other_writers(monkeypatch, tmp_path):
+    path = tmp_path / "bank.json"
+    monkeypatch.setenv("FALLBACK_QUESTIONS_PATH", str(path))
+    fallback.seed_questions("Backend", "Easy", {"questions": ["Mine 1?"]})
+
+    # another worker rewrote the file in the meantime
+    path.write_text(json.dumps([
+        {"role": "backend", "difficulty": "easy", "questions": ["Theirs?"]},
+        {"role": "data", "difficulty": "hard", "questions": ["Data Q?"]},
+    ]))
+    fallback.seed_questions("Backend", "Easy", {"questions": ["Mine 2?"]})
+
+    saved = {(e["role"], e["difficulty"]): e["questions"] for e in json.loads(path.read_text())}
+    assert saved[("backend", "easy")] == ["Mine 1?", "Mine 2?", "Theirs?"]
+    assert saved[("data", "hard")] == ["Data Q?"]
+    assert not [p for p in tmp_path.iterdir() if p.suffix == ".tmp"]
+
+
+def test_load_question_bank_reads_file(monkeypatch, tmp_path):
+    path = tmp_path / "bank.json"
+    path.write_text(json.dumps([{"role": "backend", "difficulty": "easy", "questions": ["From disk?"]}]))
+    monkeypatch.setenv("FALLBACK_QUESTIONS_PATH", str(path))
+    fallback.load_question_bank()
+    assert fallback.fallback_reply([], {"role": "Backend", "difficulty": "Easy"}) == "From disk?"
+
+
+class FakeGroq:
+    def __init__(self, create):
+        self.options = None
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=create))
+
+    def with_options(self, **options):
+        self.options = options
+        return self
+
+
+def _reply(client, monkeypatch, budget="0.2"):
+    monkeypatch.setenv("LLM_TURN_BUDGET", budget)
+    fallback.seed_questions("Backend", "Easy", {"questions": ["Bank Q?"]})
+    return asyncio.run(llm.generate_reply(client, [], "model", {"role": "Backend", "difficulty": "Easy"}))
+
+
+def test_generate_reply_uses_bank_on_timeout(monkeypatch):
+    client = FakeGroq(lambda **kwargs: time.sleep(1))
+    monkeypatch.setenv("LLM_TURN_BUDGET", "0.2")
+    fallback.seed_questions("Backend", "Easy", {"questions": ["Bank Q?"]})
+
+    async def run():
+        t0 = time.perf_counter()
+        reply = await llm.generate_reply(client, [], "model", {"role": "Backend", "difficulty": "Easy"})
+        return reply, time.perf_counter() - t0
+
+    reply, elapsed = asyncio.run(run())
+    assert reply == "Bank Q?"
+    assert elapsed < 0.9
+    assert client.options == {"max_retries": 0, "timeout": 0.2}
+
+
+def test_generate_reply_uses_bank_on_error(monkeypatch):
+    def create(**kwargs):
+        raise RuntimeError("429 rate limit")
+
+    assert _reply(FakeGroq(create), monkeypatch) == "Bank Q?"
+
+
+def test_generate_reply_without_client_or_with_bad_budget(monkeypatch):
+    assert _reply(None, monkeypatch) == "Bank Q?"
+
+    def create(**kwargs):
+        raise RuntimeError("boom")
+
+    # an unparsable budget falls back to the default instead of raising
+    assert _reply(FakeGroq(create), monkeypatch, budget="abc") == "Bank Q?"
+
+
+def test_generate_reply_returns_llm_text(monkeypatch):
+    message = SimpleNamespace(content="  How would you shard this?  ")
+    client = FakeGroq(lambda **kwargs: SimpleNamespace(choices=[SimpleNamespace(message=message)]))
+    assert _reply(client, monkeypatch) == "How would you shard this?"
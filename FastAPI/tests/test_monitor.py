@@ -0,0 +1,95 @@
+import re
+import threading
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import monitor
+
+
+@pytest.fixture(autouse=True)
+def fresh_timings(monkeypatch):
+    monkeypatch.setattr(monitor, "_route_timings", {})
+
+
+def test_stage_timings_summary():
+    t = monitor.StageTimings()
+    t.add("llm", 0.1)
+    t.add("llm", 0.3)
+    t.add("tts", 0.05)
+    assert t.summary() == {
+        "llm": {"count": 2, "avg_ms": 200.0, "max_ms": 300.0},
+        "tts": {"count": 1, "avg_ms": 50.0, "max_ms": 50.0},
+    }
+
+
+def test_merge_route_timings_keeps_per_call_stats():
+    first, second = monitor.StageTimings(), monitor.StageTimings()
+    for seconds in (0.1, 0.2, 0.3):
+        first.add("stt", seconds)
+    second.add("stt", 0.6)
+    monitor.merge_route_timings("WS /ws/interview", first)
+    monitor.merge_route_timings("WS /ws/interview", second)
+    monitor.record_route_timing("GET /health", 0.002)
+
+    assert monitor.route_timings() == {
+        "WS /ws/interview:stt": {"count": 4, "avg_ms": 300.0, "max_ms": 600.0},
+        "GET /health": {"count": 1, "avg_ms": 2.0, "max_ms": 2.0},
+    }
+
+
+def _busy_marker(stop):
+    while not stop.is_set():
+        time.sleep(0.001)
+
+
+def test_sample_profile_collapsed_stack_format():
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_marker, args=(stop,), name="marker-thread")
+    worker.start()
+    try:
+        out = monitor.sample_profile(0.2, 0.005)
+    finally:
+        stop.set()
+        worker.join()
+
+    lines = out.splitlines()
+    assert lines
+    for line in lines:
+        # "thread;frame;frame ... count"
+        assert re.fullmatch(r"\S.*;.+ \d+", line), line
+    marker = [line for line in lines if line.startswith("marker-thread;")]
+    assert marker and any("_busy_marker (test_monitor.py:" in line for line in marker)
+    counts = [int(line.rsplit(" ", 1)[1]) for line in lines]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_sample_profile_respects_deadline_with_huge_interval():
+    t0 = time.perf_counter()
+    monitor.sample_profile(0.1, 1e6)
+    assert time.perf_counter() - t0 < 1
+
+
+def test_unmatched_paths_share_one_timing_key(monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    with TestClient(app) as client:
+        for i in range(5):
+            assert client.get(f"/nope/{i}").status_code == 404
+        assert client.get("/admin/timings").status_code == 403
+        timings = client.get("/admin/timings", headers={"X-Admin-Token": "secret"}).json()["timings"]
+    assert timings["GET <unmatched>"]["count"] == 5
+    assert not [key for key in timings if "/nope" in key]
+    assert "GET /admin/timings" in timings
+
+
+def test_profile_clamps_interval(monkeypatch):
+    monkeypatch.setenv("ADMIN_TOKEN", "secret")
+    with TestClient(app) as client:
+        t0 = time.perf_counter()
+        resp = client.get("/admin/profile?seconds=0.2&interval=1000000", headers={"X-Admin-Token": "secret"})
+        assert resp.status_code == 200
+        assert time.perf_counter() - t0 < 5
+        # the lock was released, so a second profile runs too
+        assert client.get("/admin/profile?seconds=0.1", headers={"X-Admin-Token": "secret"}).status_code == 200
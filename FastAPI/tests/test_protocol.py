@@ -0,0 +1,100 @@
+import asyncio
+import json
+import struct
+
+import pytest
+
+from app.services import protocol
+
+
+class FakeSocket:
+    def __init__(self):
+        self.frames = []
+
+    async def send_text(self, data):
+        self.frames.append(("text", data))
+
+    async def send_bytes(self, data):
+        self.frames.append(("bytes", data))
+
+
+def _send(proto, *calls):
+    ws = FakeSocket()
+
+    async def run():
+        for name, *args in calls:
+            await getattr(proto, name)(ws, *args)
+
+    asyncio.run(run())
+    return ws.frames
+
+
+def test_negotiate_defaults_to_v1():
+    assert protocol.negotiate(None)[0] is None
+    assert protocol.negotiate([])[0] is None
+    sub, proto = protocol.negotiate(["something.else"])
+    assert sub is None and type(proto) is protocol.ProtocolV1
+
+
+def test_negotiate_follows_client_preference(monkeypatch):
+    monkeypatch.setattr(protocol, "msgpack", object())
+    offered = [protocol.SUBPROTOCOL_JSON, protocol.SUBPROTOCOL_MSGPACK]
+    assert protocol.negotiate(offered)[0] == protocol.SUBPROTOCOL_JSON
+    assert protocol.negotiate(list(reversed(offered)))[0] == protocol.SUBPROTOCOL_MSGPACK
+
+
+def test_negotiate_skips_msgpack_when_not_installed(monkeypatch):
+    monkeypatch.setattr(protocol, "msgpack", None)
+    sub, _ = protocol.negotiate([protocol.SUBPROTOCOL_MSGPACK, protocol.SUBPROTOCOL_JSON])
+    assert sub == protocol.SUBPROTOCOL_JSON
+    assert protocol.negotiate([protocol.SUBPROTOCOL_MSGPACK])[0] is None
+
+
+def test_v1_sends_header_then_audio():
+    frames = _send(protocol.ProtocolV1(), ("send_audio", "audio/wav", b"RIFF"), ("send_audio", "audio/wav", b""))
+    assert frames[0] == ("text", json.dumps({"type": "assistant_audio", "audio_format": "audio/wav"}))
+    assert frames[1] == ("bytes", b"RIFF")
+    # empty audio still announces the header but sends no binary frame
+    assert frames[2][0] == "text" and len(frames) == 3
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_v2_json_coalesces_header_and_audio(monkeypatch, use_orjson):
+    if not use_orjson:
+        monkeypatch.setattr(protocol, "orjson", None)
+    audio = bytes(range(256)) * 4
+    frames = _send(
+        protocol.ProtocolV2Json(),
+        ("send", {"type": "assistant_text", "text": "héllo"}),
+        ("send_audio", "audio/wav", audio),
+        ("send_audio", "audio/wav", b""),
+    )
+    assert frames[0][0] == "text"
+    assert json.loads(frames[0][1]) == {"type": "assistant_text", "text": "héllo"}
+
+    for (kind, data), expected in ((frames[1], audio), (frames[2], b"")):
+        assert kind == "bytes"
+        (header_len,) = struct.unpack(">I", data[:4])
+        header = json.loads(data[4:4 + header_len].decode("utf-8"))
+        assert header == {"type": "assistant_audio", "audio_format": "audio/wav"}
+        assert data[4 + header_len:] == expected
+    assert len(frames) == 3
+
+
+def test_v2_msgpack_round_trip():
+    msgpack = pytest.importorskip("msgpack")
+    frames = _send(
+        protocol.ProtocolV2Msgpack(),
+        ("send", {"type": "evaluation", "result": {"overall_score": 80, "strengths": ["clear"]}}),
+        ("send_audio", "audio/wav", b"\x00\x01RIFF"),
+    )
+    assert [kind for kind, _ in frames] == ["bytes", "bytes"]
+    assert msgpack.unpackb(frames[0][1], raw=False) == {
+        "type": "evaluation",
+        "result": {"overall_score": 80, "strengths": ["clear"]},
+    }
+    assert msgpack.unpackb(frames[1][1], raw=False) == {
+        "type": "assistant_audio",
+        "audio_format": "audio/wav",
+        "audio": b"\x00\x01RIFF",
+    }
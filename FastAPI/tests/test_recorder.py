@@ -0,0 +1,90 @@
+import asyncio
+
+from app.services.recorder import SessionRecorder, NullRecorder, get_session_recorder, read_session_log
+
+
+class FakeSocket:
+    def __init__(self, incoming):
+        self.incoming = list(incoming)
+        self.sent = []
+
+    async def receive(self):
+        return self.incoming.pop(0)
+
+    async def send_text(self, data):
+        self.sent.append(data)
+
+    async def send_bytes(self, data):
+        self.sent.append(data)
+
+
+async def _tts():
+    return b"wav-bytes", "audio/wav"
+
+
+async def _llm():
+    return "Tell me about yourself."
+
+
+def _record_session(path):
+    recorder = SessionRecorder(str(path))
+    ws = recorder.wrap(FakeSocket([
+        {"type": "websocket.receive", "bytes": b"\x1a\x45audio"},
+        {"type": "websocket.receive", "bytes": b""},
+        {"type": "websocket.receive", "text": '{"type": "segment_end"}'},
+    ]))
+
+    async def run():
+        recorder.event("session", {"subprotocol": None})
+        for _ in range(3):
+            await ws.receive()
+        await recorder.stage("llm", _llm())
+        await recorder.stage("tts", _tts())
+        await ws.send_text('{"type": "assistant_text"}')
+        await ws.send_bytes(b"wav-bytes")
+
+    asyncio.run(run())
+    recorder.close()
+
+
+def test_session_log_round_trip(tmp_path):
+    path = tmp_path / "session.plog"
+    _record_session(path)
+
+    records = list(read_session_log(str(path)))
+    kinds = [meta["kind"] for meta, _ in records]
+    assert kinds == ["session", "in", "in", "in", "stage", "stage", "out", "out", "timings"]
+
+    (audio_meta, audio), (empty_meta, empty), (text_meta, text_payload) = records[1:4]
+    assert audio == b"\x1a\x45audio" and audio_meta["bin"] is True
+    assert empty == b"" and empty_meta["bin"] is True
+    assert text_payload is None and text_meta["text"] == '{"type": "segment_end"}'
+
+    llm, tts = records[4][0], records[5][0]
+    assert llm["stage"] == "llm" and llm["result"] == "Tell me about yourself."
+    assert tts["stage"] == "tts" and tts["size"] == len(b"wav-bytes") and tts["mime"] == "audio/wav"
+    assert records[7][0]["size"] == len(b"wav-bytes") and records[7][1] is None
+    assert records[8][0]["stages"]["tts"]["count"] == 1
+
+    times = [meta["t"] for meta, _ in records]
+    assert times == sorted(times)
+
+
+def test_truncated_tail_is_ignored(tmp_path):
+    path = tmp_path / "session.plog"
+    _record_session(path)
+    full = list(read_session_log(str(path)))
+
+    data = path.read_bytes()
+    path.write_bytes(data[:-5])
+    assert list(read_session_log(str(path))) == full[:-1]
+
+
+def test_recording_disabled_without_dir(monkeypatch, tmp_path):
+    monkeypatch.delenv("SESSION_RECORD_DIR", raising=False)
+    assert isinstance(get_session_recorder(), NullRecorder)
+
+    monkeypatch.setenv("SESSION_RECORD_DIR", str(tmp_path))
+    recorder = get_session_recorder()
+    assert isinstance(recorder, SessionRecorder)
+    recorder.close()